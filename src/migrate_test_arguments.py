@@ -16,16 +16,35 @@ The script will:
 """
 
 import os
+import marshal
 import re
+import shutil
 import sys
 import yaml
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Set
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Set
 import argparse
+import hashlib
+import json
+import logging
+from collections import Counter
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import partial
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
 
+try:
+    # libyaml bindings are several times faster than the pure-Python loader/dumper
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
 
-# Known generic tests from various sources
+logger = logging.getLogger("migrate_test_arguments")
+
+# Known generic tests from various sources. These are documentation only: is_generic_test
+# accepts any test name that is not a config key, so known, package-prefixed and custom
+# generic tests are all migrated without consulting these sets.
 BUILTIN_GENERIC_TESTS = {
     'unique', 'not_null', 'accepted_values', 'relationships'
 }
@@ -78,8 +97,107 @@ DBT_EXPECTATIONS_TESTS = {
 # Combine all known generic tests
 ALL_GENERIC_TESTS = BUILTIN_GENERIC_TESTS | DBT_UTILS_TESTS | DBT_EXPECTATIONS_TESTS
 
+# Keys in a test definition that stay at the top level instead of moving under 'arguments'
+_RESERVED_KEYS = frozenset({'config', 'name', 'description', 'tags', 'meta', 'test_name'})
+
+# Keys that configure a test rather than name one
+_CONFIG_KEYS = frozenset({'config', 'name', 'description', 'tags', 'meta', 'arguments'})
+
+# File extensions treated as dbt resource property files
+SUFFIXES = ('.yml', '.yaml')
+
+# Matches a `tests:` or `data_tests:` key (plain or quoted); files without one are never parsed
+TESTS_KEY_PATTERN = re.compile(rb'tests[\'"]?\s*:')
+
+# Documents starting with a flow mapping or sequence may be plain JSON
+JSON_DOCUMENT_PATTERN = re.compile(rb'\s*[{\[]')
+
+
+def _resolve_yaml_scalar(literal: str) -> Any:
+    """Resolve a JSON number/constant literal the way PyYAML (YAML 1.1) reads it.
+
+    dbt reads these files with PyYAML, which treats e.g. `1e3` or `NaN` as strings, so the
+    json fast path must produce the same values the YAML loader would.
+    """
+    return yaml.load(literal, Loader=SafeLoader)
+
+# Keys holding a list of tests on any resource, table or column
+_TEST_KEYS = ('tests', 'data_tests')
+
+# Nested lists that can own tests, as (key, nesting of each child) pairs per level
+_COLUMN_LEVEL = ()
+_TABLE_LEVEL = (('columns', _COLUMN_LEVEL),)
+_RESOURCE_LEVEL = (('columns', _COLUMN_LEVEL),)
+_SOURCE_LEVEL = (('columns', _COLUMN_LEVEL), ('tables', _TABLE_LEVEL))
+
+# Resource types that can have tests
+_RESOURCE_TYPES = (
+    ('models', _RESOURCE_LEVEL),
+    ('sources', _SOURCE_LEVEL),
+    ('seeds', _RESOURCE_LEVEL),
+    ('snapshots', _RESOURCE_LEVEL),
+)
+
+
+def _iter_test_containers(content: Any) -> Iterator[tuple[Dict[str, Any], str, List[Any]]]:
+    """Yield (container, test_key, tests_list) for every test list in a YAML document.
+
+    Walks models, seeds and snapshots (and their columns) plus sources, their tables and
+    table columns with an explicit stack, in document order. Dicts reachable through
+    several YAML aliases are yielded once.
+    """
+    if not isinstance(content, dict):
+        return
+
+    stack = []
+    seen: Set[int] = set()
+    for resource_type, nesting in reversed(_RESOURCE_TYPES):
+        resources = content.get(resource_type)
+        if isinstance(resources, list):
+            stack.extend((resource, nesting) for resource in reversed(resources))
+
+    while stack:
+        node, nesting = stack.pop()
+        if not isinstance(node, dict) or id(node) in seen:
+            # Skip scalars and subtrees already visited through a YAML alias
+            continue
+        seen.add(id(node))
+
+        for test_key in _TEST_KEYS:
+            tests_list = node.get(test_key)
+            if isinstance(tests_list, list):
+                yield node, test_key, tests_list
+
+        for child_key, child_nesting in reversed(nesting):
+            children = node.get(child_key)
+            if isinstance(children, list):
+                stack.extend((child, child_nesting) for child in reversed(children))
+
 
-@dataclass
+def configure_logging() -> None:
+    """Send log output to stdout through a buffer instead of one write per message"""
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(MemoryHandler(capacity=1024, target=stream_handler))
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+
+def _init_worker_logging(queue: multiprocessing.Queue) -> None:
+    """Route a worker process's log records back to the parent through `queue`"""
+    logger.handlers[:] = [QueueHandler(queue)]
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+
+class _ForwardingHandler(logging.Handler):
+    """Hands records received from worker processes to the local logger"""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        logger.handle(record)
+
+
+@dataclass(slots=True, frozen=True)
 class TestMigration:
     """Tracks a test migration that was performed"""
     file_path: str
@@ -91,240 +209,350 @@ class TestMigration:
 class GenericTestMigrator:
     """Handles migration of generic test arguments to the new format"""
 
-    def __init__(self, models_dir: str = "models", dry_run: bool = False):
+    def __init__(self, models_dir: str = "models", dry_run: bool = False, max_workers: Optional[int] = None,
+                 cache_dir: Optional[str] = None):
         self.models_dir = Path(models_dir)
         self.dry_run = dry_run
+        self.max_workers = max_workers or os.cpu_count()
+        self.cache_dir = Path(cache_dir) if cache_dir else None
         self.migrations_performed: List[TestMigration] = []
 
     def find_yaml_files(self) -> List[Path]:
-        """Find all .yml and .yaml files in the models directory"""
-        yaml_files = []
-        for pattern in ['**/*.yml', '**/*.yaml']:
-            yaml_files.extend(self.models_dir.glob(pattern))
-        return yaml_files
-
-    def is_generic_test(self, test_key: str) -> bool:
+        """Find all .yml and .yaml files in the models directory in a single walk"""
+        return [
+            Path(root) / name
+            for root, _dirs, files in os.walk(self.models_dir)
+            for name in files
+            if name.endswith(SUFFIXES)
+        ]
+
+    @staticmethod
+    def is_generic_test(test_key: str) -> bool:
         """Check if a test key represents a known generic test"""
-        # Direct match
-        if test_key in ALL_GENERIC_TESTS:
-            return True
-
-        # Check for custom tests that might follow package.test_name format
-        if '.' in test_key:
-            return True
-
-        # Check if it looks like a custom generic test (not a config)
-        config_keys = {'config', 'name', 'description', 'tags', 'meta', 'arguments'}
-        return test_key not in config_keys
-
-    def needs_migration(self, test_dict: Dict[str, Any]) -> bool:
-        """Check if a test dictionary needs migration"""
-        if not isinstance(test_dict, dict):
-            return False
-
-        # Already has arguments key - no migration needed
-        if 'arguments' in test_dict:
-            return False
-
-        # Check if it has any keys that should be moved to arguments
-        reserved_keys = {'config', 'name', 'description', 'tags', 'meta', 'test_name'}
-
-        for key in test_dict.keys():
-            if key not in reserved_keys:
-                return True
-
-        return False
+        # Known tests (ALL_GENERIC_TESTS), package.test_name style tests and custom generic
+        # tests are all accepted; none of them can collide with a config key, so a single
+        # set lookup covers every case. Non-string keys (e.g. a list) are rejected.
+        return isinstance(test_key, str) and test_key not in _CONFIG_KEYS
 
     def migrate_test_dict(self, test_dict: Dict[str, Any]) -> Dict[str, Any]:
-        """Migrate a single test dictionary to use arguments key"""
-        if not self.needs_migration(test_dict):
+        """Migrate a single test dictionary to use arguments key.
+
+        Detection and migration happen in one pass; the input is returned unchanged
+        (the same object) when nothing needs to move.
+        """
+        if not isinstance(test_dict, dict) or 'arguments' in test_dict:
             return test_dict
 
         new_dict = {}
         arguments = {}
-        reserved_keys = {'config', 'name', 'description', 'tags', 'meta', 'test_name'}
 
         for key, value in test_dict.items():
-            if key in reserved_keys:
+            if key in _RESERVED_KEYS:
                 new_dict[key] = value
             else:
                 arguments[key] = value
 
-        if arguments:
-            new_dict['arguments'] = arguments
+        if not arguments:
+            return test_dict
 
+        new_dict['arguments'] = arguments
         return new_dict
 
-    def process_test_list(self, tests_list: List[Any]) -> tuple[List[Any], List[str]]:
-        """Process a list of tests and return migrated list plus list of migrated test names"""
+    def process_test_list(self, tests_list: List[Any],
+                          memo: Optional[Dict[int, tuple[Any, Any]]] = None) -> tuple[List[Any], Counter[str]]:
+        """Process a list of tests and return migrated list plus counts of migrated test names.
+
+        `memo` maps id() of already processed test dicts to (original, migrated) so tests
+        shared through YAML anchors are migrated and counted once.
+        """
+        if memo is None:
+            memo = {}
+
         migrated_tests = []
-        migrated_test_names = []
+        migrated_test_names: Counter[str] = Counter()
+
+        # Bind hot-loop lookups to locals once instead of on every test
+        is_generic_test = self.is_generic_test
+        migrate_test_dict = self.migrate_test_dict
+        append = migrated_tests.append
 
         for test in tests_list:
             if isinstance(test, str):
                 # Simple test name, no migration needed
-                migrated_tests.append(test)
+                append(test)
             elif isinstance(test, dict):
+                if id(test) in memo:
+                    # Aliased test that has already been processed
+                    append(memo[id(test)][1])
+                    continue
+
                 # Test with configuration
+                migrated_test = test
                 if len(test) == 1:
                     # Format: - test_name: {...}
-                    test_name, test_config = next(iter(test.items()))
-                    if self.is_generic_test(test_name) and isinstance(test_config, dict):
-                        if self.needs_migration(test_config):
-                            migrated_config = self.migrate_test_dict(test_config)
-                            migrated_tests.append({test_name: migrated_config})
-                            migrated_test_names.append(test_name)
-                        else:
-                            migrated_tests.append(test)
-                    else:
-                        migrated_tests.append(test)
-                else:
-                    # Format with test_name key or other format
-                    if 'test_name' in test:
-                        test_name = test['test_name']
-                        if self.is_generic_test(test_name):
-                            if self.needs_migration(test):
-                                migrated_test = self.migrate_test_dict(test)
-                                migrated_tests.append(migrated_test)
-                                migrated_test_names.append(test_name)
-                            else:
-                                migrated_tests.append(test)
-                        else:
-                            migrated_tests.append(test)
-                    else:
-                        migrated_tests.append(test)
+                    (test_name, test_config), = test.items()
+                    if is_generic_test(test_name) and isinstance(test_config, dict):
+                        migrated_config = migrate_test_dict(test_config)
+                        if migrated_config is not test_config:
+                            migrated_test = {test_name: migrated_config}
+                            migrated_test_names[test_name] += 1
+                elif 'test_name' in test:
+                    # Format with test_name key
+                    test_name = test['test_name']
+                    if is_generic_test(test_name):
+                        migrated_test = migrate_test_dict(test)
+                        if migrated_test is not test:
+                            migrated_test_names[test_name] += 1
+
+                # Keep the original referenced so its id() cannot be reused
+                memo[id(test)] = (test, migrated_test)
+                append(migrated_test)
             else:
-                migrated_tests.append(test)
+                append(test)
 
         return migrated_tests, migrated_test_names
 
-    def process_yaml_content(self, content: Dict[str, Any], file_path: str) -> tuple[Dict[str, Any], List[str]]:
+    def process_yaml_content(self, content: Dict[str, Any], file_path: str) -> tuple[Dict[str, Any], Counter[str]]:
         """Process YAML content and migrate tests"""
-        all_migrated_tests = []
-
-        # Process different resource types that can have tests
-        for resource_type in ['models', 'sources', 'seeds', 'snapshots']:
-            if resource_type in content:
-                for resource in content[resource_type]:
-                    # Tests at resource level
-                    if 'tests' in resource or 'data_tests' in resource:
-                        for test_key in ['tests', 'data_tests']:
-                            if test_key in resource and isinstance(resource[test_key], list):
-                                migrated_tests, migrated_names = self.process_test_list(resource[test_key])
-                                resource[test_key] = migrated_tests
-                                all_migrated_tests.extend(migrated_names)
-
-                    # Tests at column level
-                    if 'columns' in resource and isinstance(resource['columns'], list):
-                        for column in resource['columns']:
-                            if 'tests' in column or 'data_tests' in column:
-                                for test_key in ['tests', 'data_tests']:
-                                    if test_key in column and isinstance(column[test_key], list):
-                                        migrated_tests, migrated_names = self.process_test_list(column[test_key])
-                                        column[test_key] = migrated_tests
-                                        all_migrated_tests.extend(migrated_names)
-
-                    # Handle sources with tables
-                    if resource_type == 'sources' and 'tables' in resource:
-                        for table in resource['tables']:
-                            # Tests at table level
-                            if 'tests' in table or 'data_tests' in table:
-                                for test_key in ['tests', 'data_tests']:
-                                    if test_key in table and isinstance(table[test_key], list):
-                                        migrated_tests, migrated_names = self.process_test_list(table[test_key])
-                                        table[test_key] = migrated_tests
-                                        all_migrated_tests.extend(migrated_names)
-
-                            # Tests at column level within tables
-                            if 'columns' in table and isinstance(table['columns'], list):
-                                for column in table['columns']:
-                                    if 'tests' in column or 'data_tests' in column:
-                                        for test_key in ['tests', 'data_tests']:
-                                            if test_key in column and isinstance(column[test_key], list):
-                                                migrated_tests, migrated_names = self.process_test_list(column[test_key])
-                                                column[test_key] = migrated_tests
-                                                all_migrated_tests.extend(migrated_names)
+        all_migrated_tests: Counter[str] = Counter()
+        memo: Dict[int, tuple[Any, Any]] = {}
+
+        for container, test_key, tests_list in _iter_test_containers(content):
+            if id(tests_list) in memo:
+                # Test list shared through a YAML anchor; reuse the migrated list
+                container[test_key] = memo[id(tests_list)][1]
+                continue
+
+            migrated_tests, migrated_names = self.process_test_list(tests_list, memo)
+            memo[id(tests_list)] = (tests_list, migrated_tests)
+            container[test_key] = migrated_tests
+            all_migrated_tests.update(migrated_names)
 
         return content, all_migrated_tests
 
-    def migrate_file(self, file_path: Path) -> bool:
-        """Migrate a single YAML file"""
+    def load_content(self, file_path: Path) -> Any:
+        """Load a file's parsed content.
+
+        The content is None for empty files and files without a tests block. When a cache
+        directory is configured, content parsed by an earlier run is reused while the
+        file's bytes are unchanged.
+        """
+        # Read raw bytes; the content is only decoded if it is worth parsing
+        with open(file_path, 'rb') as f:
+            original_content = f.read()
+
+        # Hashing the bytes is cheap next to parsing them and, unlike mtime, cannot go stale
+        digest = hashlib.sha1(original_content).digest() if self.cache_dir is not None else None
+        cached = self.load_cached(file_path, digest)
+        if cached is not None:
+            return cached[0]
+
+        content = None
+
+        # Skip empty files and files without a tests block before decoding or parsing
+        if original_content and TESTS_KEY_PATTERN.search(original_content):
+            is_json = False
+            if JSON_DOCUMENT_PATTERN.match(original_content):
+                # JSON is a subset of YAML; JSON-style documents go through the much faster
+                # json parser first and fall back to the YAML loader if they are not strict JSON
+                try:
+                    content = json.loads(original_content,
+                                         parse_float=_resolve_yaml_scalar,
+                                         parse_constant=_resolve_yaml_scalar)
+                    is_json = True
+                except ValueError:
+                    pass
+
+            if not is_json:
+                # Parse YAML (the loader decodes the bytes itself)
+                content = yaml.load(original_content, Loader=SafeLoader)
+
+        self.store_cached(file_path, digest, content)
+        return content
+
+    def cache_entry_path(self, file_path: Path) -> Path:
+        """Path of the parse cache entry for a file"""
+        digest = hashlib.sha1(os.path.abspath(file_path).encode('utf-8')).hexdigest()
+        return self.cache_dir / f"{digest}.marshal"
+
+    def load_cached(self, file_path: Path, digest: Optional[bytes]) -> Optional[tuple[Any]]:
+        """Return (content,) cached for a file whose bytes hash to `digest`, or None if missing or stale.
+
+        Entries are stored with marshal rather than pickle, so loading one can never run code.
+        """
+        if self.cache_dir is None:
+            return None
+
         try:
-            # Read the original file content as string to preserve formatting
-            with open(file_path, 'r', encoding='utf-8') as f:
-                original_content = f.read()
+            with open(self.cache_entry_path(file_path), 'rb') as f:
+                entry = marshal.load(f)
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+
+        if not (isinstance(entry, tuple) and len(entry) == 2):
+            return None
+
+        cached_digest, content = entry
+        if cached_digest != digest:
+            return None
+
+        return (content,)
+
+    def store_cached(self, file_path: Path, digest: Optional[bytes], content: Any) -> None:
+        """Save parsed content to the cache; failures only cost a re-parse next time"""
+        if self.cache_dir is None:
+            return
 
-            # Parse YAML
+        try:
+            data = marshal.dumps((digest, content))
+        except ValueError:
+            # Values marshal cannot represent (e.g. YAML timestamps); parse this file every run
+            return
+
+        entry_path = self.cache_entry_path(file_path)
+        tmp_path = entry_path.with_name(entry_path.name + '.tmp')
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, entry_path)
+        except OSError as e:
+            tmp_path.unlink(missing_ok=True)
+            logger.warning(f"Warning: Could not write parse cache for {file_path}: {e}")
+
+    def migrate_file(self, file_path: Path) -> tuple[Path, Counter[str]]:
+        """Migrate a single YAML file.
+
+        Returns the file path and a count of the migrated tests by name (empty when
+        nothing changed). The migrator itself is not mutated so this can run in a worker process.
+        """
+        try:
             try:
-                yaml_content = yaml.safe_load(original_content)
+                yaml_content = self.load_content(file_path)
             except yaml.YAMLError as e:
-                print(f"Warning: Could not parse YAML in {file_path}: {e}")
-                return False
+                logger.warning(f"Warning: Could not parse YAML in {file_path}: {e}")
+                return file_path, Counter()
 
             if not yaml_content:
-                return False
+                return file_path, Counter()
 
             # Process the content
             migrated_content, migrated_tests = self.process_yaml_content(yaml_content, str(file_path))
 
-            if not migrated_tests:
-                # No migrations needed
-                return False
-
-            # Convert back to YAML with preserved style as much as possible
-            migrated_yaml = yaml.dump(migrated_content,
-                                    default_flow_style=False,
-                                    sort_keys=False,
-                                    allow_unicode=True,
-                                    indent=2)
-
-            # Record the migration
-            migration = TestMigration(
-                file_path=str(file_path),
-                test_name=", ".join(set(migrated_tests)),
-                arguments_moved=migrated_tests
-            )
-            self.migrations_performed.append(migration)
-
-            if not self.dry_run:
-                # Write the migrated content back
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(migrated_yaml)
-
-            print(f"{'[DRY RUN] ' if self.dry_run else ''}Migrated {len(migrated_tests)} tests in {file_path}")
-            return True
+            if not migrated_tests or self.dry_run:
+                # Nothing to write back
+                return file_path, migrated_tests
+
+            # A migrated test always gains an 'arguments' key, so the output is known to differ
+            # from the original and unchanged files never reach this point
+            self.write_yaml(file_path, migrated_content)
+
+            return file_path, migrated_tests
 
         except Exception as e:
-            print(f"Error processing {file_path}: {e}")
-            return False
+            logger.error(f"Error processing {file_path}: {e}")
+            return file_path, Counter()
+
+    def write_yaml(self, file_path: Path, content: Dict[str, Any]) -> None:
+        """Atomically replace a file with YAML content via a temporary sibling file"""
+        # Replace the real file behind a symlink rather than the link itself
+        target = Path(os.path.realpath(file_path))
+        tmp_path = target.with_name(target.name + '.tmp')
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                # Stream the YAML straight into the file, preserving style as much as possible
+                yaml.dump(content,
+                          f,
+                          Dumper=SafeDumper,
+                          default_flow_style=False,
+                          sort_keys=False,
+                          allow_unicode=True,
+                          indent=2)
+            shutil.copymode(target, tmp_path)
+            os.replace(tmp_path, target)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    def record_migration(self, file_path: Path, migrated_tests: Counter[str]) -> None:
+        """Record a migration performed on a file (main process only)"""
+        migration = TestMigration(
+            file_path=str(file_path),
+            test_name=", ".join(migrated_tests),
+            arguments_moved=list(migrated_tests.elements())
+        )
+        self.migrations_performed.append(migration)
+
+        logger.info(f"{'[DRY RUN] ' if self.dry_run else ''}Migrated {migrated_tests.total()} tests in {file_path}")
+
+    def record_results(self, results: Iterable[tuple[Path, Counter[str]]]) -> int:
+        """Record migrations as results arrive and return how many files were migrated"""
+        migrated_count = 0
+        for file_path, migrated_tests in results:
+            if migrated_tests:
+                self.record_migration(file_path, migrated_tests)
+                migrated_count += 1
+        return migrated_count
 
     def run_migration(self) -> None:
         """Run the migration on all YAML files"""
         yaml_files = self.find_yaml_files()
 
         if not yaml_files:
-            print(f"No YAML files found in {self.models_dir}")
+            logger.info(f"No YAML files found in {self.models_dir}")
             return
 
-        print(f"Found {len(yaml_files)} YAML files to process")
-        print(f"{'Running in DRY RUN mode - no files will be modified' if self.dry_run else 'Files will be modified in place'}")
-        print()
-
-        migrated_count = 0
-        for yaml_file in yaml_files:
-            if self.migrate_file(yaml_file):
-                migrated_count += 1
-
-        print()
-        print(f"Migration complete!")
-        print(f"Files processed: {len(yaml_files)}")
-        print(f"Files migrated: {migrated_count}")
-        print(f"Total test migrations: {len(self.migrations_performed)}")
+        logger.info(f"Found {len(yaml_files)} YAML files to process")
+        logger.info(f"{'Running in DRY RUN mode - no files will be modified' if self.dry_run else 'Files will be modified in place'}")
+        logger.info("")
+
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        if self.max_workers == 1 or len(yaml_files) == 1:
+            migrated_count = self.record_results(map(self.migrate_file, yaml_files))
+        else:
+            # Parsing and dumping are CPU-bound; each worker writes only its own files and
+            # sends its log records back through a queue instead of sharing stdout
+            log_queue = multiprocessing.Queue()
+            listener = QueueListener(log_queue, _ForwardingHandler())
+            listener.start()
+            try:
+                with ProcessPoolExecutor(max_workers=self.max_workers,
+                                         initializer=_init_worker_logging,
+                                         initargs=(log_queue,)) as executor:
+                    # Ship only the settings a worker needs, not the migrator and its results
+                    worker = partial(_migrate_file, self.dry_run, self.cache_dir)
+                    migrated_count = self.record_results(
+                        executor.map(worker, yaml_files, chunksize=8)
+                    )
+            finally:
+                listener.stop()
+        logger.info("")
+        logger.info("Migration complete!")
+        logger.info(f"Files processed: {len(yaml_files)}")
+        logger.info(f"Files migrated: {migrated_count}")
+        logger.info(f"Total test migrations: {len(self.migrations_performed)}")
 
         if self.migrations_performed:
-            print("\nMigrations performed:")
+            logger.info("\nMigrations performed:")
             for migration in self.migrations_performed:
-                print(f"  {migration.file_path}: {migration.test_name}")
+                logger.info(f"  {migration.file_path}: {migration.test_name}")
+
+
+def _migrate_file(dry_run: bool, cache_dir: Optional[Path], file_path: Path) -> tuple[Path, Counter[str]]:
+    """Worker process entry point: migrate one file with a migrator built from plain settings"""
+    return GenericTestMigrator(dry_run=dry_run, max_workers=1, cache_dir=cache_dir).migrate_file(file_path)
+
+
+def positive_int(value: str) -> int:
+    """argparse type that only accepts integers greater than zero"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {number}")
+    return number
 
 
 def main():
@@ -348,12 +576,27 @@ def main():
         help="Show what would be changed without modifying files"
     )
 
+    parser.add_argument(
+        "--workers",
+        type=positive_int,
+        default=None,
+        help="Number of worker processes used to parse YAML files (default: number of CPUs)"
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=None,
+        help="Directory, relative to the repository root or absolute, where parsed YAML is cached "
+             "so repeated runs (e.g. a dry run followed by a real run) skip unchanged files (default: no cache)"
+    )
+
     args = parser.parse_args()
 
+    configure_logging()
+
     project_root = Path(args.project_root).expanduser()
 
     if not project_root.exists():
-        print(f"Error: Repository root '{project_root}' not found")
+        logger.error(f"Error: Repository root '{project_root}' not found")
         sys.exit(1)
 
     project_root = project_root.resolve()
@@ -368,11 +611,18 @@ def main():
     models_dir = models_dir.resolve()
 
     if not models_dir.exists():
-        print(f"Error: Models directory '{models_dir}' not found")
-        print("Provide the repository root or models directory path that contains your dbt models")
+        logger.error(f"Error: Models directory '{models_dir}' not found")
+        logger.error("Provide the repository root or models directory path that contains your dbt models")
         sys.exit(1)
 
-    migrator = GenericTestMigrator(models_dir=models_dir, dry_run=args.dry_run)
+    cache_dir = None
+    if args.cache_dir:
+        cache_dir = Path(args.cache_dir).expanduser()
+        if not cache_dir.is_absolute():
+            cache_dir = project_root / cache_dir
+
+    migrator = GenericTestMigrator(models_dir=models_dir, dry_run=args.dry_run, max_workers=args.workers,
+                                   cache_dir=cache_dir)
     migrator.run_migration()
 
 
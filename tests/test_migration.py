@@ -1,3 +1,5 @@
+import hashlib
+import marshal
 import os
 import tempfile
 import shutil
@@ -6,6 +8,10 @@ from pathlib import Path
 import subprocess
 import sys
 import pytest
+from collections import Counter
+
+sys.path.insert(0, str(Path("src").resolve()))
+from migrate_test_arguments import GenericTestMigrator
 
 @pytest.fixture(scope="function")
 def test_project():
@@ -119,3 +125,238 @@ def test_migration_script(test_project, dry_run):
         combo_test = find_test(combo_column.get("tests", []), "dbt_utils.unique_combination_of_columns")
         assert combo_test is not None, "unique_combination_of_columns test not found"
         assert "arguments" in combo_test and "combination_of_columns" in combo_test["arguments"]
+
+def test_find_yaml_files_walks_nested_directories(tmp_path):
+    (tmp_path / "staging" / "stripe").mkdir(parents=True)
+    (tmp_path / "schema.yml").write_text("version: 2\n")
+    (tmp_path / "staging" / "sources.yaml").write_text("version: 2\n")
+    (tmp_path / "staging" / "stripe" / "stripe.yml").write_text("version: 2\n")
+    (tmp_path / "staging" / "model.sql").write_text("select 1\n")
+
+    found = GenericTestMigrator(models_dir=tmp_path).find_yaml_files()
+    assert sorted(p.relative_to(tmp_path).as_posix() for p in found) == [
+        "schema.yml",
+        "staging/sources.yaml",
+        "staging/stripe/stripe.yml",
+    ]
+
+def test_files_without_tests_are_not_parsed(tmp_path, caplog):
+    # Invalid YAML would print a parse warning if it were loaded
+    file_path = tmp_path / "exposures.yml"
+    file_path.write_text("exposures:\n  - name: [unclosed\n")
+
+    migrator = GenericTestMigrator(models_dir=tmp_path)
+    assert migrator.migrate_file(file_path) == (file_path, Counter())
+    assert "Could not parse" not in caplog.text
+
+def test_process_yaml_content_covers_all_test_containers(tmp_path):
+    content = yaml.safe_load(
+        "seeds:\n"
+        "  - name: country_codes\n"
+        "    data_tests:\n"
+        "      - dbt_utils.equal_rowcount:\n"
+        "          compare_model: ref('countries')\n"
+        "snapshots:\n"
+        "  - name: orders_snapshot\n"
+        "    columns:\n"
+        "      - name: status\n"
+        "        data_tests:\n"
+        "          - accepted_values:\n"
+        "              values: ['open', 'closed']\n"
+        "sources:\n"
+        "  - name: raw\n"
+        "    tables:\n"
+        "      - name: payments\n"
+        "        tests:\n"
+        "          - dbt_utils.recency:\n"
+        "              datepart: day\n"
+        "              field: created_at\n"
+        "              interval: 1\n"
+    )
+
+    migrator = GenericTestMigrator(models_dir=tmp_path)
+    migrated, names = migrator.process_yaml_content(content, "schema.yml")
+
+    assert sorted(names) == ["accepted_values", "dbt_utils.equal_rowcount", "dbt_utils.recency"]
+    seed_test = find_test(migrated["seeds"][0]["data_tests"], "dbt_utils.equal_rowcount")
+    assert seed_test == {"arguments": {"compare_model": "ref('countries')"}}
+    snapshot_column = migrated["snapshots"][0]["columns"][0]
+    assert "arguments" in find_test(snapshot_column["data_tests"], "accepted_values")
+    table = migrated["sources"][0]["tables"][0]
+    assert "arguments" in find_test(table["tests"], "dbt_utils.recency")
+
+def test_aliased_tests_are_migrated_once(tmp_path):
+    content = yaml.safe_load(
+        "models:\n"
+        "  - name: orders\n"
+        "    columns:\n"
+        "      - name: status\n"
+        "        tests: &status_tests\n"
+        "          - accepted_values:\n"
+        "              values: ['open', 'closed']\n"
+        "  - name: orders_archive\n"
+        "    columns:\n"
+        "      - name: status\n"
+        "        tests: *status_tests\n"
+    )
+
+    migrator = GenericTestMigrator(models_dir=tmp_path)
+    migrated, names = migrator.process_yaml_content(content, "schema.yml")
+
+    assert names == Counter({"accepted_values": 1})
+    first = migrated["models"][0]["columns"][0]["tests"]
+    second = migrated["models"][1]["columns"][0]["tests"]
+    assert first is second
+    assert find_test(first, "accepted_values") == {"arguments": {"values": ["open", "closed"]}}
+
+def test_json_style_files_are_migrated_with_yaml_values(tmp_path):
+    json_path = tmp_path / "schema.yml"
+    json_path.write_text(
+        '{"models": [{"name": "orders", "columns": [{"name": "amount", "tests": '
+        '[{"dbt_utils.accepted_range": {"min_value": 0.0000001, "max_value": 1e3, '
+        '"step": 1.5e+3, "ratio": 0.25, "count": 10}}]}]}]}\n'
+    )
+    # Flow-style YAML that is not valid JSON falls back to the YAML loader
+    flow_path = tmp_path / "flow.yml"
+    flow_path.write_text("{models: [{name: orders, tests: [{not_null: {column_name: id}}]}]}\n")
+
+    def range_test(path, key=None):
+        column = yaml.safe_load(path.read_text())["models"][0]["columns"][0]
+        test = find_test(column["tests"], "dbt_utils.accepted_range")
+        return test[key] if key else test
+
+    # dbt reads the file with PyYAML, so the values it sees must not change
+    original_arguments = range_test(json_path)
+    assert original_arguments["min_value"] == 1e-07
+    assert original_arguments["max_value"] == "1e3"
+
+    migrator = GenericTestMigrator(models_dir=tmp_path)
+    assert migrator.migrate_file(json_path)[1] == Counter({"dbt_utils.accepted_range": 1})
+    assert migrator.migrate_file(flow_path)[1] == Counter({"not_null": 1})
+
+    assert range_test(json_path, "arguments") == original_arguments
+    flow_test = find_test(yaml.safe_load(flow_path.read_text())["models"][0]["tests"], "not_null")
+    assert flow_test == {"arguments": {"column_name": "id"}}
+
+def test_parse_cache_reuses_content_until_file_changes(tmp_path):
+    file_path = tmp_path / "schema.yml"
+    file_path.write_text("models:\n  - name: a\n    tests: [unique]\n")
+    cache_dir = tmp_path / ".migrate_cache"
+    cache_dir.mkdir()
+    migrator = GenericTestMigrator(models_dir=tmp_path, cache_dir=cache_dir)
+
+    assert migrator.load_content(file_path) == {"models": [{"name": "a", "tests": ["unique"]}]}
+
+    # Unchanged bytes: the cached parse is returned, even though the mtime moved
+    entry_path = migrator.cache_entry_path(file_path)
+    entry_path.write_bytes(marshal.dumps((hashlib.sha1(file_path.read_bytes()).digest(), {"cached": True})))
+    os.utime(file_path, ns=(0, 0))
+    assert migrator.load_content(file_path) == {"cached": True}
+
+    # An edit with the same size and mtime is detected rather than served from the cache
+    stat = file_path.stat()
+    file_path.write_text("models:\n  - name: b\n    tests: [unique]\n")
+    os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert file_path.stat().st_size == stat.st_size
+    assert migrator.load_content(file_path)["models"][0]["name"] == "b"
+
+def test_migration_in_worker_pool(tmp_path):
+    script_path = Path("src") / "migrate_test_arguments.py"
+    models_dir = tmp_path / "models"
+    (models_dir / "staging").mkdir(parents=True)
+    for i in range(3):
+        (models_dir / "staging" / f"schema_{i}.yml").write_text(
+            "models:\n"
+            f"  - name: model_{i}\n"
+            "    columns:\n"
+            "      - name: status\n"
+            "        tests:\n"
+            "          - accepted_values:\n"
+            "              values: ['open', 'closed']\n"
+        )
+    (models_dir / "broken.yml").write_text("models:\n  - name: [unclosed\n    tests:\n")
+
+    result = subprocess.run(
+        [sys.executable, str(script_path), str(tmp_path), "--workers", "2"],
+        capture_output=True, text=True,
+    )
+    assert result.returncode == 0, result.stderr
+
+    for i in range(3):
+        migrated = yaml.safe_load((models_dir / "staging" / f"schema_{i}.yml").read_text())
+        test = find_test(migrated["models"][0]["columns"][0]["tests"], "accepted_values")
+        assert test == {"arguments": {"values": ["open", "closed"]}}
+    assert "Files processed: 4" in result.stdout
+    assert "Files migrated: 3" in result.stdout
+    assert "Total test migrations: 3" in result.stdout
+    assert result.stdout.count("Could not parse YAML in") == 1
+
+@pytest.mark.parametrize("workers", ["0", "-1", "two"])
+def test_workers_must_be_a_positive_integer(test_project, workers):
+    script_path = Path("src") / "migrate_test_arguments.py"
+    result = subprocess.run(
+        [sys.executable, str(script_path), test_project, "--workers", workers],
+        capture_output=True, text=True,
+    )
+    assert result.returncode == 2
+    assert "--workers" in result.stderr
+
+def test_non_string_test_name_is_left_untouched(tmp_path):
+    tests_list = [{"test_name": ["not", "a", "name"], "column_name": "id"}]
+
+    migrated, names = GenericTestMigrator(models_dir=tmp_path).process_test_list(tests_list)
+
+    assert migrated == tests_list
+    assert not names
+
+def test_write_yaml_replaces_file_atomically(tmp_path):
+    file_path = tmp_path / "schema.yml"
+    file_path.write_text("models: []\n")
+    file_path.chmod(0o640)
+
+    GenericTestMigrator(models_dir=tmp_path).write_yaml(file_path, {"models": [{"name": "orders"}]})
+
+    assert yaml.safe_load(file_path.read_text()) == {"models": [{"name": "orders"}]}
+    assert file_path.stat().st_mode & 0o777 == 0o640
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["schema.yml"]
+
+def test_symlinked_schema_files_are_migrated_through_the_link(tmp_path):
+    shared_dir = tmp_path / "shared"
+    models_dir = tmp_path / "models"
+    shared_dir.mkdir()
+    models_dir.mkdir()
+    real_path = shared_dir / "real.yml"
+    real_path.write_text(
+        "models:\n"
+        "  - name: orders\n"
+        "    tests:\n"
+        "      - dbt_utils.expression_is_true:\n"
+        "          expression: \"amount > 0\"\n"
+    )
+    link_path = models_dir / "link.yml"
+    link_path.symlink_to(Path("..") / "shared" / "real.yml")
+
+    GenericTestMigrator(models_dir=models_dir, max_workers=1).run_migration()
+
+    assert link_path.is_symlink()
+    migrated = yaml.safe_load(real_path.read_text())
+    test = find_test(migrated["models"][0]["tests"], "dbt_utils.expression_is_true")
+    assert test == {"arguments": {"expression": "amount > 0"}}
+    assert sorted(p.name for p in shared_dir.iterdir()) == ["real.yml"]
+
+def test_parse_cache_ignores_foreign_entries_and_unmarshallable_content(tmp_path):
+    cache_dir = tmp_path / ".migrate_cache"
+    cache_dir.mkdir()
+    migrator = GenericTestMigrator(models_dir=tmp_path, cache_dir=cache_dir)
+
+    file_path = tmp_path / "schema.yml"
+    file_path.write_text("models:\n  - name: a\n    tests: [unique]\n")
+    # A pickle (or any other non-marshal payload) planted in the cache is never executed
+    migrator.cache_entry_path(file_path).write_bytes(b"cos\nsystem\n(S'exit 1'\ntR.")
+    assert migrator.load_content(file_path)["models"][0]["name"] == "a"
+
+    # YAML timestamps cannot be marshalled; such files are simply not cached
+    dated_path = tmp_path / "dated.yml"
+    dated_path.write_text("models:\n  - name: b\n    meta: {since: 2024-01-01}\n    tests: [unique]\n")
+    assert migrator.load_content(dated_path)["models"][0]["name"] == "b"
+    assert not migrator.cache_entry_path(dated_path).exists()